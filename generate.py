@@ -1,10 +1,11 @@
 import bpy
+import csv
 import math
-import mathutils
 import random
-import bmesh
 import os
 import shutil
+import threading
+import numpy as np
 
 # Paths and directories
 base_path = os.getcwd()
@@ -14,6 +15,9 @@ input_base_images_path = os.path.join(input_path_materials, "Base")
 input_floor_images_path = os.path.join(input_path_materials, "Floor")
 fallback_material_path = os.path.join(input_floor_images_path, "fallback")
 
+# Texture properties that make up one floor material
+floor_texture_properties = ("color", "displacement", "metallic", "normal", "roughness")
+
 # Clear selection before starting script
 bpy.ops.object.select_all(action="DESELECT")
 
@@ -23,13 +27,36 @@ sun = bpy.data.objects["Sun"]
 camera = bpy.data.objects["Camera"]
 floor = bpy.data.objects["Floor"]
 
+# Make sure the piece template carries a UV layer. Every generated piece
+# inherits it through copy/bake/join, so the per-piece existence check in
+# output_uv_data never has to create one mid-run.
+if len(piece.data.uv_layers) == 0:
+    piece.data.uv_layers.new()
+
+# Cached reference to the piece material's specular input, so setting it
+# doesn't re-walk material_slots -> node_tree -> nodes -> inputs every piece
+piece_specular_input = piece.material_slots[0].material.node_tree.nodes["Principled BSDF"].inputs["Specular"]
+
+# Dedicated RNG instance; its bound methods skip the per-call module-level
+# indirection of the random.* convenience functions and can be hoisted into
+# locals in the hot paths
+rng = random.Random()
+
+# NumPy generator for the batched draws; one call hands back a whole array of
+# randoms instead of re-entering the generator state per scalar
+np_rng = np.random.default_rng()
+
+# Degrees to radians multiplier, hoisted so the hot randomisation paths pay a
+# single FP multiply instead of a math.radians call per value
+deg_to_rad = math.pi / 180.0
+
 # Global lists used in multiple methods
 pieces = []
 modifier_froms = []
 modifier_tos = []
 
 # Stores positions in (x, y, z) of each modifier's starting position
-modifier_positions = [
+modifier_positions = np.array([
     # Corners
     [1, 1, 0],
     [1, -1, 0],
@@ -41,12 +68,16 @@ modifier_positions = [
     [0, 1.4, 0],
     [-1.4, 0, 0],
     [1.4, 0, 0]
-]
+], dtype=np.float32)
 
 # Random variables used in multiple methods, automatically modified at runtime.
 piece_overall_scale = 0
 piece_end_scale = 0
 
+# Per-axis UV multipliers for the current base image's aspect ratio.
+# Computed once per base image in set_base_image rather than per piece.
+base_image_aspect = (1.0, 1.0)
+
 # Output resolution. X by Y.
 # Jigsaw piece will remain centered regardless of resolution.
 # Resolutions with extreme ratios will cause the edge of the floor to become visible.
@@ -138,35 +169,46 @@ enable_random_rotation_of_piece = False
 
 # Randomise the environment
 def random_env():
+    # Hoist the bound method into a local for the repeated draws below
+    uniform = rng.uniform
+
+    # Draw all nine symmetric offsets (sun rotation XYZ, camera location XYZ,
+    # camera rotation XYZ) in one vectorized call and scale per use
+    env_draws = np_rng.uniform(-1.0, 1.0, 9)
+
     if enable_lighting:
         # Sun rotation/angle
-        sun.rotation_euler.x = math.radians(random.uniform(-sun_rotation_limit_degrees, sun_rotation_limit_degrees))
-        sun.rotation_euler.y = math.radians(random.uniform(-sun_rotation_limit_degrees, sun_rotation_limit_degrees))
-        sun.rotation_euler.z = math.radians(random.uniform(-sun_rotation_limit_degrees, sun_rotation_limit_degrees))
+        sun.rotation_euler.x = (env_draws[0] * sun_rotation_limit_degrees) * deg_to_rad
+        sun.rotation_euler.y = (env_draws[1] * sun_rotation_limit_degrees) * deg_to_rad
+        sun.rotation_euler.z = (env_draws[2] * sun_rotation_limit_degrees) * deg_to_rad
 
         # Sun energy and sun SPREAD angle (not direction, it controls shadow sharpness)
-        sun.data.energy = random.uniform(sun_energy_range[0], sun_energy_range[1])
-        sun.data.angle = random.uniform(sun_spread_angle_range_degrees[0], sun_spread_angle_range_degrees[1])
+        sun.data.energy = uniform(sun_energy_range[0], sun_energy_range[1])
+        sun.data.angle = uniform(sun_spread_angle_range_degrees[0], sun_spread_angle_range_degrees[1])
 
         # Random light tint to simulate different lighting conditions
-        # Generate 3 random numbers as RGB and average them with the light's default color (white)
-        light_random_tint = [random.random(), random.random(), random.random()]
-        for i in range(0, 3):
-            sun.data.color[i] = (sun.data.color[i] + light_random_tint[i]) / 2
+        # Generate 3 random numbers as RGB and average them with the light's
+        # default color (white) in one whole-vector write instead of three
+        # per-channel read-modify-writes through RNA
+        light_random_tint = np_rng.random(3)
+        color = sun.data.color
+        sun.data.color = ((color[0] + light_random_tint[0]) / 2,
+                          (color[1] + light_random_tint[1]) / 2,
+                          (color[2] + light_random_tint[2]) / 2)
 
     if enable_camera_randomness:
         # Random location of camera
-        camera.location.x += random.uniform(-camera_location_random, camera_location_random)
-        camera.location.y += random.uniform(-camera_location_random, camera_location_random)
-        camera.location.z += random.uniform(-camera_location_random, camera_location_random)
+        camera.location.x += env_draws[3] * camera_location_random
+        camera.location.y += env_draws[4] * camera_location_random
+        camera.location.z += env_draws[5] * camera_location_random
 
         # Random rotation of camera
-        camera.rotation_euler.x += math.radians(random.uniform(-camera_rotation_random, camera_rotation_random))
-        camera.rotation_euler.y += math.radians(random.uniform(-camera_rotation_random, camera_rotation_random))
-        camera.rotation_euler.z += math.radians(random.uniform(-camera_rotation_random, camera_rotation_random))
+        camera.rotation_euler.x += (env_draws[6] * camera_rotation_random) * deg_to_rad
+        camera.rotation_euler.y += (env_draws[7] * camera_rotation_random) * deg_to_rad
+        camera.rotation_euler.z += (env_draws[8] * camera_rotation_random) * deg_to_rad
 
         # Random camera focal length
-        camera.data.lens = random.uniform(camera_lens[0], camera_lens[1])
+        camera.data.lens = uniform(camera_lens[0], camera_lens[1])
 
     # Move to randomise the floor
     random_floor()
@@ -175,31 +217,38 @@ def random_env():
 # Randomise the floor scale, rotation, and texture
 def random_floor():
     # Choose a random image...
-    random_index = random.randrange(0, len(input_floor_images))
+    random_index = rng.randrange(0, len(input_floor_images["color"]))
 
     # ...and apply each component to the floor
-    apply_to_floor(random_index, "color")
-    apply_to_floor(random_index, "displacement")
-    apply_to_floor(random_index, "metallic")
-    apply_to_floor(random_index, "normal")
-    apply_to_floor(random_index, "roughness")
+    for property in floor_texture_properties:
+        apply_to_floor(random_index, property)
 
     # Randomise the floor rotation and scale
-    floor.rotation_euler.z = math.radians(random.uniform(0, 360))
-    floor_scale = random.uniform(floor_scale_range[0], floor_scale_range[1])
+    floor.rotation_euler.z = (rng.uniform(0, 360)) * deg_to_rad
+    floor_scale = rng.uniform(floor_scale_range[0], floor_scale_range[1])
     floor.scale = [floor_scale, floor_scale, 1]
 
 
+# Tracks which path is currently loaded into each floor image slot so
+# re-picking the same floor doesn't hit the disk again
+applied_floor_paths = {}
+
+
 # Apply a 'property' to the floor texture
 # Property refers to "color", "normal", "roughness", etc...
 def apply_to_floor(index, property):
-    if input_floor_images[index].get(property):
-        bpy.data.images[property].filepath = input_floor_images[index][property]
-    else:
-        # If the texture has no such property, use a fallback
-        bpy.data.images[property].filepath = os.path.join(fallback_material_path, property)
+    # Fallback paths were resolved at startup, so this is a direct lookup
+    path = input_floor_images[property][index]
+
+    # Skip the reload (a full disk read and decode) if the image slot
+    # already holds this texture
+    if applied_floor_paths.get(property) == path:
+        return
+
+    applied_floor_paths[property] = path
 
     # Reload the image from the updated filepath
+    bpy.data.images[property].filepath = path
     bpy.data.images[property].reload()
 
 
@@ -207,8 +256,8 @@ def apply_to_floor(index, property):
 def randomise():
     global piece_overall_scale, piece_end_scale
 
-    piece_overall_scale = random.uniform(piece_image_scale_range[0], piece_image_scale_range[1])
-    piece_end_scale = random.uniform(piece_end_scale_range[0], piece_end_scale_range[1])
+    piece_overall_scale = rng.uniform(piece_image_scale_range[0], piece_image_scale_range[1])
+    piece_end_scale = rng.uniform(piece_end_scale_range[0], piece_end_scale_range[1])
 
 
 # Generate the whole piece from the piece section
@@ -225,27 +274,36 @@ def generate_piece(piece_id):
     modifier = piece.modifiers.new(name="Weld", type="WELD")
     modifier.merge_threshold = 0.005
 
-    # Loop to create the 'empties' and associated warp modifiers to randomise the piece
-    for i in range(0, 8):
-        # Create to new empties, one as the warp original location, one as the warp target location
-        modifier_froms.append(bpy.data.objects.new("empty", None))
-        modifier_tos.append(bpy.data.objects.new("empty", None))
-
-        # Place the objects in the world
-        bpy.context.collection.objects.link(modifier_froms[i])
-        bpy.context.collection.objects.link(modifier_tos[i])
-
-        # Set the 'original location' empty's position to the position as declared in the modifier_positions list.
+    # Create all the empties up front as fixed-size lists (one warp original
+    # location and one warp target location per warp anchor) instead of
+    # growing the global lists append-by-append for every piece
+    modifier_froms[:] = [bpy.data.objects.new("empty", None) for i in range(len(modifier_positions))]
+    modifier_tos[:] = [bpy.data.objects.new("empty", None) for i in range(len(modifier_positions))]
+
+    # Draw every 'target location' empty's random XY offset and scale in one
+    # vectorized call each, instead of four uniform() calls per empty
+    target_locations = modifier_positions[:, :2] + np_rng.uniform(
+        -piece_warp_location_randomness, piece_warp_location_randomness,
+        size=(len(modifier_positions), 2))
+    target_scales = piece_end_scale + np_rng.uniform(
+        -piece_warp_scale_randomness, piece_warp_scale_randomness,
+        size=(len(modifier_positions), 2))
+
+    # Loop to configure the 'empties' and associated warp modifiers to randomise the piece
+    for i in range(0, len(modifier_positions)):
+        # Configure each empty fully before linking it into the collection:
+        # property writes on an unlinked object don't tag the depsgraph, so
+        # the scene only sees one update per empty instead of one per write
+
+        # Set the 'original location' empty's position to the position as declared in the modifier_positions array.
         modifier_froms[i].location = modifier_positions[i]
 
-        # Set the 'target location' empties position to a random location relative to the 'original'
-        modifier_tos[i].location.x = modifier_positions[i][0] + (random.uniform(-piece_warp_location_randomness, piece_warp_location_randomness))
-        modifier_tos[i].location.y = modifier_positions[i][1] + (random.uniform(-piece_warp_location_randomness, piece_warp_location_randomness))
-        
-        # Also randomise scale
-        modifier_tos[i].scale.x = piece_end_scale + (random.uniform(-piece_warp_scale_randomness, piece_warp_scale_randomness))
-        modifier_tos[i].scale.y = piece_end_scale + (random.uniform(-piece_warp_scale_randomness, piece_warp_scale_randomness))
-        
+        # Set the 'target location' empty's position to a random location
+        # relative to the 'original', and randomise its scale. Whole-vector
+        # assignments: one RNA write each instead of one per axis.
+        modifier_tos[i].location = (target_locations[i, 0], target_locations[i, 1], 0.0)
+        modifier_tos[i].scale = (target_scales[i, 0], target_scales[i, 1], 1.0)
+
         # Create a warp modifier, configure the settings, and add it to the piece
         modifier = piece.modifiers.new(name="Warp", type="WARP")
         modifier.falloff_radius = 1.0
@@ -253,29 +311,37 @@ def generate_piece(piece_id):
         modifier.object_from = modifier_froms[i]
         modifier.object_to = modifier_tos[i]
 
+    # Place all the configured empties in the world in one tight pass, with
+    # the link method resolved once instead of per call
+    link = bpy.context.collection.objects.link
+    for empty in modifier_froms:
+        link(empty)
+    for empty in modifier_tos:
+        link(empty)
+
     # Duplicate the piece section four times to create a full piece.
     for i in range(0, 4):
-        # Create a copy of the object and place it in the list
+        # Create a copy of the object and place it in the list.
+        # The copy shares the template's mesh data: the depsgraph bake below
+        # replaces it with a freshly built mesh anyway, so a deep data copy
+        # per section would be thrown away immediately.
         new_piece = piece.copy()
         pieces.append(new_piece)
 
-        # Copy over the object data
-        new_piece.data = piece.data.copy()
-
         # Set the rotation
-        new_piece.rotation_euler[2] = math.radians(i * 90)
+        new_piece.rotation_euler[2] = (i * 90) * deg_to_rad
 
         # Create a mask modifier that will show and hide different vertex groups
-        modifier = new_piece.modifiers.new(name="Mask " + str(i), type="MASK")
+        modifier = new_piece.modifiers.new(name="Mask", type="MASK")
         modifier.use_smooth = True
 
         # Choose the type of piece side
         # E.g. Inward connector, outward connector, or edge.
-        type_index = random.random()
+        type_index = rng.random()
 
         # First check if it isn't an edge...
         if (type_index < piece_type_cutoff_edge):
-            type_index = random.random()
+            type_index = rng.random()
             # Then check if inward or outward
             if (type_index < piece_type_cutoff_inward):
                 type_index = "Inward"
@@ -290,10 +356,20 @@ def generate_piece(piece_id):
         # Add the piece section to the scene
         bpy.context.collection.objects.link(new_piece)
 
-        # Set the piece section as active and apply the mask modifier
-        # Needs to be applied otherwise the name will conflict with modifiers from other pieces when joined.
-        bpy.context.view_layer.objects.active = new_piece
-        bpy.ops.object.modifier_apply(modifier="Mask " + str(i))
+        # Bake the whole modifier stack (weld, warps, and mask) into a new
+        # mesh through the depsgraph instead of running a modifier_apply
+        # operator per section. preserve_all_data_layers keeps the UVs and
+        # the vertex groups the mask and corner lookups rely on.
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        baked_mesh = bpy.data.meshes.new_from_object(
+            new_piece.evaluated_get(depsgraph),
+            preserve_all_data_layers=True,
+            depsgraph=depsgraph)
+
+        # The displaced data is the template's shared mesh, so it must not be
+        # freed here
+        new_piece.data = baked_mesh
+        new_piece.modifiers.clear()
 
         # Set the piece as selected (needed for 'join' later)
         new_piece.select_set(True)
@@ -306,199 +382,200 @@ def generate_piece(piece_id):
     bpy.context.view_layer.objects.active = pieces[0]
     bpy.ops.object.join()
 
-    # Apply all modifiers
-    for modifier in bpy.context.view_layer.objects.active.modifiers:
-        bpy.ops.object.modifier_apply(modifier=modifier.name)
+    # Weld the seams where the joined sections meet (the sections were baked
+    # individually, so the overlapping boundary vertices still need merging),
+    # baked through the depsgraph like the per-section stacks above.
+    joined_piece = bpy.context.view_layer.objects.active
+    modifier = joined_piece.modifiers.new(name="Weld", type="WELD")
+    modifier.merge_threshold = 0.005
+
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    baked_mesh = bpy.data.meshes.new_from_object(
+        joined_piece.evaluated_get(depsgraph),
+        preserve_all_data_layers=True,
+        depsgraph=depsgraph)
+    old_mesh = joined_piece.data
+    joined_piece.data = baked_mesh
+    joined_piece.modifiers.clear()
+    bpy.data.meshes.remove(old_mesh)
+
+    # Recalculate the origin (where 0,0,0 is) based on the center of the randomised piece.
+    # The joined object already sits at the world origin, so shifting the mesh
+    # by minus its centroid both recenters the origin and centers the piece,
+    # without a bpy.ops.object.origin_set round trip through the operator system.
+    co_buf = np.empty(len(joined_piece.data.vertices) * 3, dtype=np.float32)
+    joined_piece.data.vertices.foreach_get("co", co_buf)
+    co_buf = co_buf.reshape(-1, 3)
+    co_buf -= co_buf.mean(axis=0)
+    joined_piece.data.vertices.foreach_set("co", co_buf.ravel())
+    joined_piece.data.update()
 
-    # Recalculate the origin (where 0,0,0 is) based on the center of mass of the randomised piece
-    bpy.ops.object.origin_set(type="ORIGIN_CENTER_OF_MASS")
     # Center the object
-    bpy.context.view_layer.objects.active.location = [0, 0, 0]
+    joined_piece.location = [0, 0, 0]
 
     # Calculate the UV data for the piece and output it to a file
-    output_uv_data(piece_id)
+    output_uv_data(piece_id, joined_piece)
 
     # Create a solidify modifier to give the piece some thickness
-    modifier = bpy.context.view_layer.objects.active.modifiers.new(name="Solidify", type="SOLIDIFY")
-    modifier.thickness = random.uniform(piece_solidify_thickness_range[0], piece_solidify_thickness_range[1])
+    modifier = joined_piece.modifiers.new(name="Solidify", type="SOLIDIFY")
+    modifier.thickness = rng.uniform(piece_solidify_thickness_range[0], piece_solidify_thickness_range[1])
 
     # Create a subdivision surface modifier to increase the resolution of the mesh, and make it rounded.
-    modifier = bpy.context.view_layer.objects.active.modifiers.new(name="Subdivide", type="SUBSURF")
+    modifier = joined_piece.modifiers.new(name="Subdivide", type="SUBSURF")
     modifier.levels = 3
     modifier.render_levels = 3
 
     # Create a bevel to emulate the die-cut nature of pieces.
-    modifier = bpy.context.view_layer.objects.active.modifiers.new(name="Bevel", type="BEVEL")
+    modifier = joined_piece.modifiers.new(name="Bevel", type="BEVEL")
     modifier.segments = 4
-    modifier.width = random.uniform(piece_bevel_thickness_range[0], piece_bevel_thickness_range[1])
+    modifier.width = rng.uniform(piece_bevel_thickness_range[0], piece_bevel_thickness_range[1])
 
     # Give the piece a random specular value (emulate the glossy finish)
-    piece.material_slots[0].material.node_tree.nodes["Principled BSDF"].inputs["Specular"].default_value = random.uniform(piece_specular_range[0], piece_specular_range[1])
+    piece_specular_input.default_value = rng.uniform(piece_specular_range[0], piece_specular_range[1])
+
+
+# Apply the full UV transform to a flat (N, 2) UV buffer in place:
+# aspect squish, piece scale, x-flip, optional random rotation, and the
+# randomised offset that keeps the UV inside the 0..1 range.
+# Kept as a standalone NumPy kernel so the whole transform runs as a handful
+# of vectorized C-level ops; output_uv_data only handles the mesh access
+# around it.
+def transform_uv_kernel(uv_buf):
+    # Squish to correct aspect ratio (the UV does not respect the aspect ratio
+    # of the base image), apply the generated scale for the piece, and fix
+    # flipped x-axis images, all fused into a single pass over the buffer
+    uv_buf *= np.array([
+        -base_image_aspect[0] * piece_overall_scale,
+        base_image_aspect[1] * piece_overall_scale,
+    ], dtype=np.float32)
 
+    if enable_random_rotation_of_piece:
+        # Give the piece's image a random rotation about the UV center
+        # (2x2 rotation matrix applied to the whole buffer at once)
+        angle = (rng.random() * 360) * deg_to_rad
+        cos_a, sin_a = math.cos(angle), math.sin(angle)
+        rotation = np.array([[cos_a, -sin_a], [sin_a, cos_a]], dtype=np.float32)
+        uv_buf = (uv_buf - 0.5) @ rotation.T + 0.5
 
-# Generate the UV coords for the piece and output
-def output_uv_data(piece_id):
-    global current_csv_output
+    # At this point, the UV is still in the center of the base
+    # Create an AABB (axis-aligned bounding box) for calculating maximum UV movement
+    uv_mins = uv_buf.min(axis=0)
+    uv_sizes = uv_buf.max(axis=0) - uv_mins
 
-    # Add base image to CSV
-    current_csv_output += current_image_id + ".jpg" + ","
+    # Calculate the random offset with a maximum of 1.0 minus the size.
+    # This ensures that the UV will never exceed 1.0.
+    uv_offset_x = rng.uniform(0.0, 1.0 - uv_sizes[0])
+    uv_offset_y = rng.uniform(0.0, 1.0 - uv_sizes[1])
 
-    # Add the piece id to the CSV output
-    current_csv_output += str(piece_id) + ","
+    # Reset the whole UV to 0, 0 and add the random offset in one pass
+    uv_buf[:, 0] += uv_offset_x - uv_mins[0]
+    uv_buf[:, 1] += uv_offset_y - uv_mins[1]
 
-    # Activate edit mode so we can unwrap the mesh
-    bpy.context.view_layer.objects.active.select_set(True)
-    bpy.ops.object.mode_set(mode="EDIT")
+    return uv_buf
+
+
+# Generate the UV coords for the piece (passed in as obj, saving the
+# bpy.context.view_layer.objects.active lookup) and output
+def output_uv_data(piece_id, obj):
+    # Start this piece's CSV row with the base image and the piece id
+    csv_row = [current_image_id + ".jpg", str(piece_id)]
+
+    mesh = obj.data
 
-    # Select all vertices
-    bpy.ops.mesh.select_all(action="SELECT")
+    # If the mesh has never been unwrapped, create a new layer to place the
+    # vertices on. Done before entering edit mode, since layers can only be
+    # added in object mode.
+    if len(mesh.uv_layers) == 0:
+        mesh.uv_layers.new()
 
-    # If the mesh has never been unwrapped, create a new layer to place the vertices on.
-    if len(bpy.context.view_layer.objects.active.data.uv_layers) == 0:
-        bpy.context.view_layer.objects.active.data.uv_layers.new()
+    # Select everything for the unwrap by writing the selection flags straight
+    # into the mesh data (selection set in object mode carries into edit
+    # mode), skipping the select_all operator and its poll/undo overhead
+    mesh.vertices.foreach_set("select", np.ones(len(mesh.vertices), dtype=bool))
+    mesh.edges.foreach_set("select", np.ones(len(mesh.edges), dtype=bool))
+    mesh.polygons.foreach_set("select", np.ones(len(mesh.polygons), dtype=bool))
+
+    # Activate edit mode so we can unwrap the mesh.
+    # This is the only EDIT round trip per piece; everything after the unwrap
+    # operates on the object mode mesh data directly.
+    obj.select_set(True)
+    bpy.ops.object.mode_set(mode="EDIT")
 
     # Unwrap the UV using Blender's default unwrap method and return to object view
     bpy.ops.uv.unwrap(method="ANGLE_BASED", fill_holes=True, correct_aspect=True, use_subsurf_data=False, margin=0.001)
     bpy.ops.object.mode_set(mode="OBJECT")
 
-    # Get every corner vertex's XY coord.
+    # Get every corner vertex's XY coord as a quantized (rounded) tuple in a set.
     # A corner vertex is a vertex that belongs to the vertex group 'Corner'
+    # Rounding makes the coords hashable with a stable key, so corner matching
+    # below is an O(1) set lookup instead of a linear scan over Vectors.
     # Note: At this point, we are still operating on a low resolution (low number of vertices) jigsaw piece
-    corner_xys = []
-    for vertex in bpy.context.object.data.vertices:
+    corner_group_index = obj.vertex_groups["Corner"].index
+    corner_xys = set()
+    for vertex in mesh.vertices:
         for group in vertex.groups:
-            if group.group == bpy.context.object.vertex_groups["Corner"].index:
-                corner_xys.append(vertex.co.xy)
-
-    # Move back to edit mode and create a new bmesh which gives us easier access to UV information
-    bpy.ops.object.mode_set(mode="EDIT")
-    bm = bmesh.from_edit_mesh(bpy.context.active_object.data)
-
-    # Get the UV layer (or create one if it doesn't exist)
-    uv_layer = bm.loops.layers.uv.verify()
-
-    # Squish to correct aspect ratio
-    # Currently, the UV does not respect the aspect ratio of the base image
-    for face in bm.faces:
-        for loop in face.loops:
-            # If wider than tall, squish on the Y axis
-            if bpy.data.images["baseimage"].size[0] < bpy.data.images["baseimage"].size[1]:
-                aspect_ratio = bpy.data.images["baseimage"].size[0] / bpy.data.images["baseimage"].size[1]
-                loop[uv_layer].uv.y *= aspect_ratio
-            else:
-                # Else, squish on X axis
-                aspect_ratio = bpy.data.images["baseimage"].size[1] / bpy.data.images["baseimage"].size[0]
-                loop[uv_layer].uv.x *= aspect_ratio
-
-            # Apply generated scale for piece
-            loop[uv_layer].uv.x *= piece_overall_scale
-            loop[uv_layer].uv.y *= piece_overall_scale
+            if group.group == corner_group_index:
+                corner_xys.add((round(vertex.co.x, 6), round(vertex.co.y, 6)))
+                break
 
-            # Fix flipped x-axis images
-            loop[uv_layer].uv.x *= -1
+    # Pull the whole UV layer into a NumPy buffer in one call so every
+    # transform below is a vectorized pass instead of a per-loop Python walk
+    uv_buf = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+    mesh.uv_layers.active.data.foreach_get("uv", uv_buf)
+    uv_buf = uv_buf.reshape(-1, 2)
 
-    if enable_random_rotation_of_piece:
-        # Give the piece's image a random rotation
-        bmesh.ops.rotate(bm, cent=[0.5, 0.5, 0.5], matrix=mathutils.Matrix.Rotation(math.radians(random.random() * 360), 3, "Z"))
+    # Run the whole UV transform as one vectorized kernel
+    uv_buf = transform_uv_kernel(uv_buf)
 
-    # At this point, the UV is still in the center of the base
-    # Create an AABB (axis-aligned bounding box) for calculating maximum UV movement
-    uv_min_x = 9999  # UV coords are between 0 and 1 anyway
-    uv_min_y = 9999
-    uv_max_x = -9999
-    uv_max_y = -9999
-
-    # For each vertex...
-    for face in bm.faces:
-        for loop in face.loops:
-            # ...check if we need to update any mins or maxes
-            if uv_min_x > loop[uv_layer].uv.x:
-                uv_min_x = loop[uv_layer].uv.x
-            if uv_min_y > loop[uv_layer].uv.y:
-                uv_min_y = loop[uv_layer].uv.y
-            if uv_max_x < loop[uv_layer].uv.x:
-                uv_max_x = loop[uv_layer].uv.x
-            if uv_max_y < loop[uv_layer].uv.y:
-                uv_max_y = loop[uv_layer].uv.y
-
-    # Get the size of the AABB
-    uv_x_size = (uv_max_x - uv_min_x)
-    uv_y_size = (uv_max_y - uv_min_y)
-
-    # Calculate the random offset with a maximum of 1.0 minus the size.
-    # This ensures that the UV will never exceed 1.0.
-    uv_offset_x = random.uniform(0.0, 1.0 - uv_x_size)
-    uv_offset_y = random.uniform(0.0, 1.0 - uv_y_size)
+    # Write the transformed UVs back to the mesh in one call
+    mesh.uv_layers.active.data.foreach_set("uv", uv_buf.ravel())
 
     # Currently found corners
     corner_count = 0
 
     coords_for_csv = []
 
-    # Move the whole UV to the randomised offset and record the corner UV positions
-    for face in bm.faces:
-        for loop in face.loops:
-            # Reset to 0, 0
-            loop[uv_layer].uv.x -= uv_min_x
-            loop[uv_layer].uv.y -= uv_min_y
-
-            # Add random offset
-            loop[uv_layer].uv.x += uv_offset_x
-            loop[uv_layer].uv.y += uv_offset_y
+    # Record the corner UV positions
+    for loop_index, loop in enumerate(mesh.loops):
+        vertex_co = mesh.vertices[loop.vertex_index].co
+        vertex_key = (round(vertex_co.x, 6), round(vertex_co.y, 6))
 
-            # If the UV is a corner...
-            if loop.vert.co.xy in corner_xys:
-                # Remove it from the list to prevent overlapping corners where the duplicated pieces meet.
-                corner_xys.remove(loop.vert.co.xy)
+        # If the UV is a corner...
+        if vertex_key in corner_xys:
+            # Remove it from the set to prevent overlapping corners where the duplicated pieces meet.
+            corner_xys.discard(vertex_key)
 
-                corner_count += 1
+            corner_count += 1
 
-                # Save cords for csv output
-                coords_for_csv.append((loop[uv_layer].uv.x, loop[uv_layer].uv.y))
+            # Save cords for csv output
+            coords_for_csv.append((float(uv_buf[loop_index, 0]), float(uv_buf[loop_index, 1])))
 
-                # When have all the corners log them to the CSV output
-                if corner_count == 4:
-                    # Sort so that bottom left and top left in first half of list
-                    coords_for_csv.sort()
+            # When have all the corners log them to the CSV output
+            if corner_count == 4:
+                # Sort so that bottom left and top left in first half of list
+                coords_for_csv.sort()
 
-                    # Put bottom left before top left
-                    if coords_for_csv[0][1] > coords_for_csv[1][1]:
-                        coords_for_csv[0], coords_for_csv[1] = coords_for_csv[1], coords_for_csv[0]
+                # Put bottom left before top left
+                if coords_for_csv[0][1] > coords_for_csv[1][1]:
+                    coords_for_csv[0], coords_for_csv[1] = coords_for_csv[1], coords_for_csv[0]
 
-                    # Put top right before bottom right
-                    if coords_for_csv[2][1] < coords_for_csv[3][1]:
-                        coords_for_csv[2], coords_for_csv[3] = coords_for_csv[3], coords_for_csv[2]
+                # Put top right before bottom right
+                if coords_for_csv[2][1] < coords_for_csv[3][1]:
+                    coords_for_csv[2], coords_for_csv[3] = coords_for_csv[3], coords_for_csv[2]
 
-                    # Add cords to csv output
-                    for x, y in coords_for_csv:
-                        if corner_count > 1:
-                            current_csv_output += str(x) + "," + str(y) + ","
-                        else:
-                            current_csv_output += str(x) + "," + str(y) + "\n"
-                        corner_count -= 1
-
-    # Applies the UV that was edited in the bmesh back to the original object
-    bmesh.update_edit_mesh(bpy.context.active_object.data)
-
-    # Return to object mode
-    bpy.ops.object.mode_set(mode="OBJECT")
+                # Add cords to the row and stream it straight to the CSV
+                for x, y in coords_for_csv:
+                    csv_row.append(x)
+                    csv_row.append(y)
+                csv_writer.writerow(csv_row)
 
 
 # Returns the scene/collection to original settings so the script can repeat correctly
 def clean_up():
-    # Deselect all objects and select only objects we need to delete
-    bpy.ops.object.select_all(action="DESELECT")
-    for obj in modifier_froms:
-        obj.select_set(True)
-
-    for obj in modifier_tos:
-        obj.select_set(True)
-
-    # This stores the main (joined) jigsaw piece
-    pieces[0].select_set(True)
-
-    # Delete the objects
-    bpy.ops.object.delete()
+    # Remove the helper empties, the joined piece (pieces[0]), and its baked
+    # mesh datablock in one batch call; batch_remove skips the operator
+    # machinery and does a single unlink pass over all the IDs at once
+    bpy.data.batch_remove(ids=(*modifier_froms, *modifier_tos, pieces[0], pieces[0].data))
 
     # Reset randomised values to defaults
     floor.rotation_euler.z = 0
@@ -519,7 +596,7 @@ def clean_up():
     piece.modifiers.clear()
 
     # Reset specular
-    mat = piece.material_slots[0].material.node_tree.nodes["Principled BSDF"].inputs["Specular"].default_value = 0.0
+    piece_specular_input.default_value = 0.0
 
     # Clear the lists
     modifier_tos.clear()
@@ -527,47 +604,21 @@ def clean_up():
     pieces.clear()
 
 
-# Check if a texture exists for a given property and return it inside a dictionary
-def floor_get_from_path(path, property, dict):
-    new_dict = dict
-
-    # Check for both JPGs and PNGs.
-    if (os.path.exists(os.path.join(path, property + ".jpg"))):
-        new_dict[property] = os.path.join(path, property + ".jpg")
-    if (os.path.exists(os.path.join(path, property + ".png"))):
-        new_dict[property] = os.path.join(path, property + ".png")
-
-    return new_dict
-
-
 # Renders the scene to a file
 def render(piece_id):
-    # Set resolution
-    bpy.context.scene.render.resolution_x = render_resolution[0]
-    bpy.context.scene.render.resolution_y = render_resolution[1]
-
     # Move camera to keep piece at constant size regardless of resolution
-    move_back_mult = (max(render_resolution[0], render_resolution[1]) / min(render_resolution[0], render_resolution[1])) - 1
-    camera.location.z += (3 * move_back_mult)
+    # (the multiplier is fixed and computed once at startup)
+    camera.location.z += (3 * camera_move_back_mult)
 
     # Set the filepath and render a single frame
     bpy.context.scene.render.filepath = os.path.join(output_path, piece_id + ".png")
     bpy.ops.render.render(write_still=True)
 
 
-# Write corner output to CSV
+# Finalise the corner output CSV
 def write_csv():
-    # Create the associated output file
-    file = open(os.path.join(output_path, "data.csv"), "w")
-
-    # Write headers
-    file.write("base_path,piece_id,lower_left_x,lower_left_y,top_left_x,top_left_y,top_right_x,top_right_y,bottom_right_x,bottom_right_y\n")
-    
-    # Write piece data...
-    file.write(current_csv_output)
-
-    # Close file.
-    file.close()
+    # Rows are streamed to disk as pieces are generated; just close the file.
+    csv_file.close()
 
 
 # User input common config options
@@ -600,56 +651,100 @@ def user_configure():
 
 # Ready output variables
 def ready_output():
-    global current_csv_output, current_image_filename, current_image_id
-    current_csv_output = ""
+    global csv_file, csv_writer, current_image_filename, current_image_id
+
+    # Open the CSV up front and stream one row per piece as it is generated.
+    # Nothing accumulates in memory, and an interrupted run keeps every row
+    # written so far.
+    csv_file = open(os.path.join(output_path, "data.csv"), "w", newline="")
+    csv_writer = csv.writer(csv_file)
+
+    # Write headers
+    csv_writer.writerow(["base_path", "piece_id",
+                         "lower_left_x", "lower_left_y", "top_left_x", "top_left_y",
+                         "top_right_x", "top_right_y", "bottom_right_x", "bottom_right_y"])
+
     current_image_filename = ""
     current_image_id = ""
 
 
 # Apply the base image to the piece
 def set_base_image(base_image_path):
-    global current_image_filename
+    global current_image_filename, base_image_aspect
 
     # Set image filename for CSV
     current_image_filename = os.path.basename(base_image_path)
 
+    # Repeated draws (mode 2) often pick the same base back to back; skip the
+    # reload and full image re-decode when it is already loaded. The cached
+    # aspect ratio is still valid in that case too.
+    if bpy.data.images["baseimage"].filepath == base_image_path:
+        return
+
     # Set the base image
     bpy.data.images["baseimage"].filepath = base_image_path
     bpy.data.images["baseimage"].reload()
 
+    # Cache the per-axis UV squish for this image's aspect ratio.
+    # If taller than wide, squish on the Y axis, else squish on the X axis.
+    width, height = bpy.data.images["baseimage"].size
+    if width < height:
+        base_image_aspect = (1.0, width / height)
+    else:
+        base_image_aspect = (height / width, 1.0)
+
 
 # Begin execution here...
 # Create the output path if it doesn't exist
 if not os.path.exists(output_path):
     os.makedirs(output_path)
 
+# One-time render settings: the resolution never changes between pieces, and
+# persistent data keeps scene data (BVHs, loaded images) alive between
+# renders instead of rebuilding it for every frame
+bpy.context.scene.render.resolution_x = render_resolution[0]
+bpy.context.scene.render.resolution_y = render_resolution[1]
+bpy.context.scene.render.use_persistent_data = True
+
+# How far back the camera moves per render to keep the piece at a constant
+# size regardless of resolution
+camera_move_back_mult = (max(render_resolution[0], render_resolution[1]) / min(render_resolution[0], render_resolution[1])) - 1
+
 # Get all input images as paths
+# os.scandir hands back DirEntry objects whose stat info and full path are
+# cached from the directory read, so no extra stat call or join per file
 input_base_images = []
-for image in os.listdir(input_base_images_path):
-    if os.path.isdir(os.path.join(input_base_images_path, image)):
+for entry in os.scandir(input_base_images_path):
+    if entry.is_dir():
         continue
-    input_base_images.append(os.path.join(input_base_images_path, image))
+    input_base_images.append(entry.path)
 
-# Get all floor texture files as paths inside dictionaries
-input_floor_images = []
-for image_index in os.listdir(input_floor_images_path):
+# Get all floor texture files as paths, one list per property
+# (structure-of-arrays), with missing textures already resolved to the
+# fallback path so per-render application is a plain list index
+input_floor_images = {property: [] for property in floor_texture_properties}
+for entry in os.scandir(input_floor_images_path):
     # Do not process the fallback as a proper image
-    if image_index == "fallback":
+    if entry.name == "fallback":
         continue
 
     # Get the path to the current floor folder
-    floor_path_full = os.path.join(input_floor_images_path, image_index)
+    floor_path_full = entry.path
 
-    # Populate the dictionary with valid texture properties
+    # Classify every file in the floor folder with one directory scan
+    # instead of stat'ing a .jpg and a .png per property.
+    # PNGs take priority over JPGs of the same property.
     temp_dict = {}
-    temp_dict = floor_get_from_path(floor_path_full, "color", temp_dict)
-    temp_dict = floor_get_from_path(floor_path_full, "displacement", temp_dict)
-    temp_dict = floor_get_from_path(floor_path_full, "metallic", temp_dict)
-    temp_dict = floor_get_from_path(floor_path_full, "normal", temp_dict)
-    temp_dict = floor_get_from_path(floor_path_full, "roughness", temp_dict)
+    for texture in os.scandir(floor_path_full):
+        property, extension = os.path.splitext(texture.name)
+        if property in floor_texture_properties and extension in (".jpg", ".png"):
+            if property not in temp_dict or extension == ".png":
+                temp_dict[property] = texture.path
 
-    # Save the dictionary to a global list
-    input_floor_images.append(temp_dict)
+    # Save each property's path (or its fallback) to the property's list
+    for property in floor_texture_properties:
+        input_floor_images[property].append(
+            temp_dict.get(property, os.path.join(fallback_material_path, property)))
 
 # Begin user input
 print("Select generation mode:\n 1.\tGenerate X images per base\n 2.\tGenerate X images using random bases")
@@ -666,6 +761,10 @@ if generation_mode == 1:
 
     ready_output()
 
+    # Base image copies are plain file I/O with no dependency on the scene,
+    # so they run on background threads and overlap with piece setup/rendering
+    copy_threads = []
+
     # For-loop to coordinate the process
     for base_index in range(0, len(input_base_images)):
 
@@ -674,7 +773,11 @@ if generation_mode == 1:
 
         # Copy the base file to the output directory with an appropriate name
         if enable_base_image_copy:
-            shutil.copyfile(input_base_images[base_index], os.path.join(output_path, current_image_id + ".jpg"))
+            copy_thread = threading.Thread(
+                target=shutil.copyfile,
+                args=(input_base_images[base_index], os.path.join(output_path, current_image_id + ".jpg")))
+            copy_thread.start()
+            copy_threads.append(copy_thread)
 
         # Begin generation loop...
         for count in range(0, images_per_base):
@@ -693,6 +796,10 @@ if generation_mode == 1:
             # Then clean up...
             clean_up()
 
+    # Wait for any outstanding base image copies before finishing
+    for copy_thread in copy_threads:
+        copy_thread.join()
+
     # Write CSV
     write_csv()
 
@@ -706,7 +813,7 @@ elif generation_mode == 2:
     # For-loop to coordinate the process
     for index in range(images_total):
         # Choose random base image
-        random_image = random.choice(input_base_images)
+        random_image = rng.choice(input_base_images)
         set_base_image(random_image)
         current_image_id = current_image_filename
 